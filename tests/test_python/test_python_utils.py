@@ -14,6 +14,7 @@ loaded first before executing unit tests.
 #pylint: disable=invalid-name
 
 import unittest
+from unittest import mock
 import glob
 import tempfile
 import os
@@ -111,12 +112,123 @@ class Testing(unittest.TestCase):
             # Make sure a file is copied
             util.cp_vrfy(f"{self.ushdir}/python_utils/misc.py", f"{testable_path}/miscs.py")
             self.assertTrue(os.path.exists(f"{testable_path}/miscs.py"))
+            util.cp_vrfy(f"{self.ushdir}/python_utils/misc.py", f"{testable_path}/misc2.py",
+                         reflink=False)
+            self.assertTrue(os.path.exists(f"{testable_path}/misc2.py"))
+
+            # Make sure a new copy gets the source's mode less the umask, and an
+            # existing one keeps its own mode
+            umask = os.umask(0o022)
+            try:
+                os.chmod(f"{testable_path}/misc2.py", 0o750)
+                util.cp_vrfy(f"{testable_path}/misc2.py", f"{testable_path}/misc3.py")
+                self.assertEqual(os.stat(f"{testable_path}/misc3.py").st_mode & 0o777, 0o750)
+                os.chmod(f"{testable_path}/misc2.py", 0o777)
+                util.cp_vrfy(f"{testable_path}/misc2.py", f"{testable_path}/misc4.py")
+                self.assertEqual(os.stat(f"{testable_path}/misc4.py").st_mode & 0o777, 0o755)
+                os.chmod(f"{testable_path}/miscs.py", 0o600)
+                util.cp_vrfy(f"{testable_path}/misc2.py", f"{testable_path}/miscs.py")
+                self.assertEqual(os.stat(f"{testable_path}/miscs.py").st_mode & 0o777, 0o600)
+            finally:
+                os.umask(umask)
+
+            # Make sure a kernel copy that stops short falls back to a full copy
+            src = f"{self.ushdir}/python_utils/misc.py"
+            with mock.patch("os.copy_file_range", return_value=0, create=True), \
+                    mock.patch("os.sendfile", return_value=0, create=True):
+                util.cp_vrfy(src, f"{testable_path}/misc5.py", reflink=False)
+            with open(src, "rb") as fsrc, open(f"{testable_path}/misc5.py", "rb") as fdst:
+                self.assertEqual(fsrc.read(), fdst.read())
+
+            # Make sure copying a file onto itself fails and leaves it intact
+            size = os.path.getsize(f"{testable_path}/miscs.py")
+            with self.assertRaises(SystemExit):
+                util.cp_vrfy(f"{testable_path}/miscs.py", f"{testable_path}/../dir/miscs.py")
+            self.assertEqual(os.path.getsize(f"{testable_path}/miscs.py"), size)
 
             # Run a platform native command
             util.cmd_vrfy(f"rm -rf {testable_path}")
 
             self.assertFalse(os.path.exists(testable_path))
 
+    def test_copy_if_stale(self):
+        """ Test copying a file only if the copy is out of date"""
+
+        with tempfile.TemporaryDirectory(
+            dir=os.path.abspath("."),
+            prefix="copy_space",
+            ) as tmp_dir:
+
+            # Make sure an up-to-date copy is left alone, and a stale one replaced
+            src = f"{self.ushdir}/python_utils/misc.py"
+            dst = f"{tmp_dir}/misc_copy.py"
+            util.copy_if_stale(src, dst)
+            with open(dst, "w", encoding="utf-8") as fn:
+                fn.write("#" * os.path.getsize(src))
+            mtime = os.stat(src).st_mtime_ns
+            os.utime(dst, ns=(mtime, mtime))
+            util.copy_if_stale(src, dst)
+            with open(dst, encoding="utf-8") as fn:
+                self.assertEqual(set(fn.read()), {"#"})
+            os.utime(dst, ns=(mtime - 10**9, mtime - 10**9))
+            util.copy_if_stale(src, dst)
+            with open(src, encoding="utf-8") as fsrc, open(dst, encoding="utf-8") as fdst:
+                self.assertEqual(fsrc.read(), fdst.read())
+
+            # Make sure a copy of a read-only source stays writable and can be refreshed
+            ro_src = f"{tmp_dir}/readonly.py"
+            util.cp_vrfy(src, ro_src)
+            os.chmod(ro_src, 0o444)
+            util.copy_if_stale(ro_src, dst)
+            self.assertTrue(os.stat(dst).st_mode & 0o200)
+            os.chmod(ro_src, 0o644)
+            with open(ro_src, "a", encoding="utf-8") as fn:
+                fn.write("# changed\n")
+            os.chmod(ro_src, 0o444)
+            util.copy_if_stale(ro_src, dst)
+            with open(ro_src, encoding="utf-8") as fsrc, open(dst, encoding="utf-8") as fdst:
+                self.assertEqual(fsrc.read(), fdst.read())
+            self.assertEqual(glob.glob(f"{tmp_dir}/*.tmp"), [])
+
+    def test_ln_mv_vrfy(self):
+        """ Test the in-process ln, mv and mkdir commands"""
+
+        with tempfile.TemporaryDirectory(
+            dir=os.path.abspath("."),
+            prefix="ln_space",
+            ) as tmp_dir:
+
+            # Experiment directory reached through a symlink
+            util.mkdir_vrfy("-p", f"{tmp_dir}/real/expt", f"{tmp_dir}/home/fix")
+            os.symlink(f"{tmp_dir}/real/expt", f"{tmp_dir}/home/expt")
+            for fn in ("a", "b"):
+                with open(f"{tmp_dir}/home/fix/{fn}", "w", encoding="utf-8") as f:
+                    f.write(fn)
+
+            # Relative links are computed from the resolved paths, as GNU ln -r does
+            util.ln_vrfy("-sf --relative", f"{tmp_dir}/home/fix/a", f"{tmp_dir}/home/expt/a")
+            link = f"{tmp_dir}/home/expt/a"
+            self.assertEqual(os.readlink(link), "../../home/fix/a")
+            with open(link, encoding="utf-8") as f:
+                self.assertEqual(f.read(), "a")
+
+            # -f replaces an existing link
+            util.ln_vrfy("-sf", f"{tmp_dir}/home/fix/b", link)
+            self.assertEqual(os.readlink(link), f"{tmp_dir}/home/fix/b")
+
+            # A trailing directory target gets links named after the sources
+            util.ln_vrfy("-sf", f"{tmp_dir}/home/fix/a", f"{tmp_dir}/home/fix/b",
+                         f"{tmp_dir}/real")
+            self.assertEqual(os.readlink(f"{tmp_dir}/real/a"), f"{tmp_dir}/home/fix/a")
+            self.assertEqual(os.readlink(f"{tmp_dir}/real/b"), f"{tmp_dir}/home/fix/b")
+
+            # mv into a directory, then rename
+            util.mv_vrfy(f"{tmp_dir}/home/fix/a", f"{tmp_dir}/real/expt")
+            self.assertTrue(os.path.isfile(f"{tmp_dir}/real/expt/a"))
+            util.mv_vrfy(f"{tmp_dir}/real/expt/a", f"{tmp_dir}/real/expt/c")
+            self.assertFalse(os.path.exists(f"{tmp_dir}/real/expt/a"))
+            self.assertTrue(os.path.isfile(f"{tmp_dir}/real/expt/c"))
+
     def test_run_command(self):
         """ Test the return of the run_command task is as expected."""
         self.assertEqual(util.run_command("echo hello"), (0, "hello", ""))
@@ -216,6 +328,12 @@ class Testing(unittest.TestCase):
         self.assertIn(
             "regional_workflow", util.get_ini_value(cfg, "regional_workflow", "repo_url")
         )
+        # json file; integers beyond 64 bits must come back exact
+        with tempfile.NamedTemporaryFile("w", suffix=".json", dir=os.path.abspath(".")) as fn:
+            fn.write('{"big": 123456789012345678901234, "small": [1, 2.5]}')
+            fn.flush()
+            cfg = util.load_json_config(fn.name)
+        self.assertEqual(cfg, {"big": 123456789012345678901234, "small": [1, 2.5]})
 
     def test_print_msg(self):
         """ Test that a bool is returned from print_info_msg"""
@@ -3,6 +3,7 @@
 import sys
 import logging
 import platform
+from importlib.util import find_spec
 from textwrap import dedent
 
 
@@ -15,12 +16,10 @@ def check_python_version():
         Exception: If Python version is less than 3.6
     """
 
-    # Check for non-standard python packages
-    try:
-        import jinja2
-        import yaml
-        import f90nml
-    except ImportError as error:
+    # Check for non-standard python packages. Only locate them here; they are
+    # imported by the modules that use them.
+    missing = [pkg for pkg in ("jinja2", "yaml", "f90nml") if find_spec(pkg) is None]
+    if missing:
         logging.error(
             dedent(
                 """
@@ -28,7 +27,7 @@ def check_python_version():
                 """
             )
         )
-        raise
+        raise ImportError(f"No module named {', '.join(repr(pkg) for pkg in missing)}")
 
     # check python version
     major, minor, patch = platform.python_version_tuple()
@@ -11,39 +11,101 @@ import argparse
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from stat import S_IXUSR
 from string import Template
-from textwrap import dedent
+from textwrap import dedent, indent
 
-from uwtools.api.config import get_nml_config, get_yaml_config, realize
-from uwtools.api.template import render
+from uwtools.api.config import get_nml_config, realize
 
 from python_utils import (
     list_to_str,
     log_info,
-    import_vars,
     export_vars,
     cp_vrfy,
+    copy_if_stale,
     ln_vrfy,
     mkdir_vrfy,
     mv_vrfy,
     check_for_preexist_dir_file,
     cfg_to_yaml_str,
-    find_pattern_in_str,
     flatten_dict,
+    load_config_cached,
+    load_yaml_json_cached,
 )
 
 from setup import setup
 from set_fv3nml_sfc_climo_filenames import set_fv3nml_sfc_climo_filenames
+from render_rocoto_xml import render_rocoto_xml
+from stoch_phys_nml import build_nam_stochy, build_spp_nml_stanzas
 from get_crontab_contents import add_crontab_line
 from check_python_version import check_python_version
 
+# Messages logged at the end of experiment generation. They are dedented once
+# here, and their {}-fields are only filled in if they are logged.
+# pylint: disable=line-too-long
+_ROCOTO_INSTRUCTIONS = indent(dedent(
+    """
+    To launch the workflow, change location to the experiment directory
+    (EXPTDIR) and issue the rocotrun command, as follows:
+
+      > cd {exptdir}
+      > {rocotorun_cmd}
+
+    To check on the status of the workflow, issue the rocotostat command
+    (also from the experiment directory):
+
+      > {rocotostat_cmd}
+
+    Note that:
+
+    1) The rocotorun command must be issued after the completion of each
+       task in the workflow in order for the workflow to submit the next
+       task(s) to the queue.
+
+    2) In order for the output of the rocotostat command to be up-to-date,
+       the rocotorun command must be issued immediately before issuing the
+       rocotostat command.
+
+    For automatic resubmission of the workflow (say every {cron_relaunch_intvl_mnts} minutes), the
+    following line can be added to the user's crontab (use 'crontab -e' to
+    edit the cron table):
+
+    */{cron_relaunch_intvl_mnts} * * * * cd {exptdir} && ./launch_FV3LAM_wflow.sh called_from_cron="TRUE"
+    """
+), "  ")
+# pylint: enable=line-too-long
+
+_COMPLETION_BANNER = indent(dedent(
+    """
+    ========================================================================
+
+        Experiment generation completed.  The experiment directory is:
+
+          EXPTDIR='{}'
+
+    ========================================================================
+    """
+), "  ")
+
+_FATAL_ERROR_MSG = dedent(
+    """
+    *********************************************************************
+    FATAL ERROR:
+    Experiment generation failed. See the error message(s) printed below.
+    For more detailed information, check the log file from the workflow
+    generation script: {}
+    *********************************************************************\n
+    """
+)
+
 # pylint: disable=too-many-locals,too-many-branches, too-many-statements
 def generate_FV3LAM_wflow(
         ushdir,
         config: str = "config.yaml",
         logfile: str = "log.generate_FV3LAM_wflow",
-        debug: bool = False) -> str:
+        debug: bool = False,
+        use_reflinks: bool = True) -> str:
     """
     Sets up a forecast experiment and creates a workflow (according to the parameters specified 
     in the configuration file)
@@ -52,6 +114,8 @@ def generate_FV3LAM_wflow(
         ushdir  (str) : The full path of the ``ush/`` directory where this script is located
         logfile (str) : The name of the file where logging is written
         debug   (bool): Enable extra output for debugging
+        use_reflinks (bool): Try copy-on-write clones when copying files into the experiment
+                             (can be turned off for filesystems such as NFS)
     Returns:
         EXPTDIR (str) : The full path of the directory where this experiment has been generated
     """
@@ -88,6 +152,7 @@ def generate_FV3LAM_wflow(
         expt_config["workflow"]["EXPTDIR"],
         wflow_xml_fn,
     )
+    use_rocoto = expt_config["platform"]["WORKFLOW_MANAGER"] == "rocoto"
     #
     # -----------------------------------------------------------------------
     #
@@ -99,7 +164,8 @@ def generate_FV3LAM_wflow(
     #
     # -----------------------------------------------------------------------
     #
-    if expt_config["platform"]["WORKFLOW_MANAGER"] == "rocoto":
+    xml_render = None
+    if use_rocoto:
 
         template_xml_fp = os.path.join(
             expt_config["user"]["PARMdir"],
@@ -107,20 +173,33 @@ def generate_FV3LAM_wflow(
         )
 
         log_info(
-            f"""
+            """
             Creating rocoto workflow XML file (WFLOW_XML_FP):
-              WFLOW_XML_FP = '{wflow_xml_fp}'"""
+              WFLOW_XML_FP = '{}'""",
+            wflow_xml_fp,
         )
 
         #
-        # Call the python script to generate the experiment's XML file
+        # Generate the experiment's XML file. This is independent of the
+        # staging of fix files below, so render it in the background while
+        # those are copied and collect the result afterwards.
         #
         rocoto_yaml_fp = expt_config["workflow"]["ROCOTO_YAML_FP"]
-        render(
-            input_file = template_xml_fp,
-            output_file = wflow_xml_fp,
-            values_src = rocoto_yaml_fp,
+
+        # Commands for running the workflow, printed at the end
+        wflow_db_fn = f"{os.path.splitext(wflow_xml_fn)[0]}.db"
+        rocotorun_cmd = f"rocotorun -w {wflow_xml_fn} -d {wflow_db_fn} -v 10"
+        rocotostat_cmd = f"rocotostat -w {wflow_xml_fn} -d {wflow_db_fn} -v 10"
+
+        render_executor = ThreadPoolExecutor(max_workers=1)
+        xml_render = render_executor.submit(
+            render_rocoto_xml,
+            template_xml_fp,
+            wflow_xml_fp,
+            rocoto_yaml_fp,
+            os.path.join(expt_config["workflow"]["EXPTDIR"], ".wflow_xml.cache"),
             )
+        render_executor.shutdown(wait=False)
     #
     # -----------------------------------------------------------------------
     #
@@ -133,11 +212,13 @@ def generate_FV3LAM_wflow(
     wflow_launch_script_fp = expt_config["workflow"]["WFLOW_LAUNCH_SCRIPT_FP"]
     wflow_launch_script_fn = expt_config["workflow"]["WFLOW_LAUNCH_SCRIPT_FN"]
     log_info(
-        f"""
+        """
         Creating symlink in the experiment directory (EXPTDIR) that points to the
         workflow launch script (WFLOW_LAUNCH_SCRIPT_FP):
-          EXPTDIR = '{exptdir}'
-          WFLOW_LAUNCH_SCRIPT_FP = '{wflow_launch_script_fp}'""",
+          EXPTDIR = '{}'
+          WFLOW_LAUNCH_SCRIPT_FP = '{}'""",
+        exptdir,
+        wflow_launch_script_fp,
         verbose=debug,
     )
 
@@ -167,15 +248,19 @@ def generate_FV3LAM_wflow(
     #
     # -----------------------------------------------------------------------
     #
-    # From here on out, going back to setting variables for everything
-    # in the flattened expt_config dictionary
-    # TODO: Reference all these variables in their respective
-    # dictionaries, instead.
-    import_vars(dictionary=flatten_dict(expt_config))
-    export_vars(source_dict=flatten_dict(expt_config))
+    flat_expt_config = flatten_dict(expt_config)
+    export_vars(source_dict=flat_expt_config)
+
+    # From here on out, reference variables through their sections of
+    # expt_config
+    platform_config = expt_config["platform"]
+    workflow_config = expt_config["workflow"]
+    global_sect = expt_config["global"]
+    fcst_config = expt_config["task_run_fcst"]
+    grid_params = expt_config["grid_params"]
+    fixed_files = expt_config["fixed_files"]
 
-    # pylint: disable=undefined-variable
-    if USE_CRON_TO_RELAUNCH:
+    if workflow_config["USE_CRON_TO_RELAUNCH"]:
         add_crontab_line(called_from_cron=False,machine=expt_config["user"]["MACHINE"],
                          crontab_line=expt_config["workflow"]["CRONTAB_LINE"],
                          exptdir=exptdir,debug=debug)
@@ -183,34 +268,52 @@ def generate_FV3LAM_wflow(
     #
     # Copy or symlink fix files
     #
-    if SYMLINK_FIX_FILES:
+    if workflow_config["SYMLINK_FIX_FILES"]:
         log_info(
-            f"""
+            """
             Symlinking fixed files from system directory (FIXgsm) to a subdirectory (FIXam):
-              FIXgsm = '{FIXgsm}'
-              FIXam = '{FIXam}'""",
+              FIXgsm = '{}'
+              FIXam = '{}'""",
+            platform_config["FIXgsm"],
+            workflow_config["FIXam"],
             verbose=debug,
         )
 
-        ln_vrfy(f"""-fsn '{FIXgsm}' '{FIXam}'""")
+        # Leave an existing link that already points at FIXgsm alone
+        fixam = workflow_config["FIXam"]
+        if not (os.path.islink(fixam) and os.readlink(fixam) == platform_config["FIXgsm"]):
+            ln_vrfy(f"""-fsn '{platform_config['FIXgsm']}' '{fixam}'""")
     else:
 
         log_info(
-            f"""
+            """
             Copying fixed files from system directory (FIXgsm) to a subdirectory (FIXam):
-              FIXgsm = '{FIXgsm}'
-              FIXam = '{FIXam}'""",
+              FIXgsm = '{}'
+              FIXam = '{}'""",
+            platform_config["FIXgsm"],
+            workflow_config["FIXam"],
             verbose=debug,
         )
 
-        check_for_preexist_dir_file(FIXam, "delete")
-        mkdir_vrfy("-p", FIXam)
-        mkdir_vrfy("-p", os.path.join(FIXam, "fix_co2_proj"))
-
-        num_files = len(FIXgsm_FILES_TO_COPY_TO_FIXam)
-        for i in range(num_files):
-            fn = f"{FIXgsm_FILES_TO_COPY_TO_FIXam[i]}"
-            cp_vrfy(os.path.join(FIXgsm, fn), os.path.join(FIXam, fn))
+        # Reuse an existing FIXam directory from a previous generation; only
+        # files that are missing or differ from FIXgsm are copied below
+        fixam = workflow_config["FIXam"]
+        if os.path.islink(fixam) or not os.path.isdir(fixam):
+            check_for_preexist_dir_file(fixam, "delete")
+        mkdir_vrfy("-p", fixam)
+        mkdir_vrfy("-p", os.path.join(fixam, "fix_co2_proj"))
+
+        # The copies are independent and I/O-bound, so run them concurrently
+        max_workers = min(16, 2 * (os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(
+                lambda fn: copy_if_stale(
+                    os.path.join(platform_config["FIXgsm"], fn),
+                    os.path.join(fixam, fn),
+                    reflink=use_reflinks,
+                ),
+                fixed_files["FIXgsm_FILES_TO_COPY_TO_FIXam"],
+            ))
     #
     # -----------------------------------------------------------------------
     #
@@ -218,26 +321,36 @@ def generate_FV3LAM_wflow(
     #
     # -----------------------------------------------------------------------
     #
-    if USE_MERRA_CLIMO:
+    if fcst_config["USE_MERRA_CLIMO"]:
         log_info(
-            f"""
+            """
             Copying MERRA2 aerosol climatology data files from system directory
             (FIXaer/FIXlut) to a subdirectory (FIXclim) in the experiment directory:
-              FIXaer = '{FIXaer}'
-              FIXlut = '{FIXlut}'
-              FIXclim = '{FIXclim}'""",
+              FIXaer = '{}'
+              FIXlut = '{}'
+              FIXclim = '{}'""",
+            platform_config["FIXaer"],
+            platform_config["FIXlut"],
+            workflow_config["FIXclim"],
             verbose=debug,
         )
 
-        check_for_preexist_dir_file(FIXclim, "delete")
-        mkdir_vrfy("-p", FIXclim)
+        fixclim = workflow_config["FIXclim"]
+        check_for_preexist_dir_file(fixclim, "delete")
+        mkdir_vrfy("-p", fixclim)
 
-        if SYMLINK_FIX_FILES:
-            ln_vrfy("-fsn", os.path.join(FIXaer, "merra2.aerclim*.nc"), FIXclim)
-            ln_vrfy("-fsn", os.path.join(FIXlut, "optics*.dat"), FIXclim)
+        aerclim_files = os.path.join(platform_config["FIXaer"], "merra2.aerclim*.nc")
+        optics_files = os.path.join(platform_config["FIXlut"], "optics*.dat")
+        if workflow_config["SYMLINK_FIX_FILES"]:
+            ln_vrfy("-fsn", aerclim_files, fixclim)
+            ln_vrfy("-fsn", optics_files, fixclim)
         else:
-            cp_vrfy(os.path.join(FIXaer, "merra2.aerclim*.nc"), FIXclim)
-            cp_vrfy(os.path.join(FIXlut, "optics*.dat"), FIXclim)
+            cp_vrfy(aerclim_files, fixclim, reflink=use_reflinks)
+            cp_vrfy(optics_files, fixclim, reflink=use_reflinks)
+
+    # Wait for the rocoto XML render started above (re-raising any error it hit)
+    if xml_render is not None:
+        xml_render.result()
     #
     # -----------------------------------------------------------------------
     #
@@ -256,14 +369,22 @@ def generate_FV3LAM_wflow(
         Copying the template data table file to the experiment directory...""",
         verbose=debug,
     )
-    cp_vrfy(DATA_TABLE_TMPL_FP, DATA_TABLE_FP)
+    cp_vrfy(
+        workflow_config["DATA_TABLE_TMPL_FP"],
+        workflow_config["DATA_TABLE_FP"],
+        reflink=use_reflinks,
+    )
 
     log_info(
         """
         Copying the template field table file to the experiment directory...""",
         verbose=debug,
     )
-    cp_vrfy(FIELD_TABLE_TMPL_FP, FIELD_TABLE_FP)
+    cp_vrfy(
+        workflow_config["FIELD_TABLE_TMPL_FP"],
+        workflow_config["FIELD_TABLE_FP"],
+        reflink=use_reflinks,
+    )
 
     #
     # Copy the CCPP physics suite definition file from its location in the
@@ -276,7 +397,11 @@ def generate_FV3LAM_wflow(
         the forecast model directory structure to the experiment directory...""",
         verbose=debug,
     )
-    cp_vrfy(CCPP_PHYS_SUITE_IN_CCPP_FP, CCPP_PHYS_SUITE_FP)
+    cp_vrfy(
+        workflow_config["CCPP_PHYS_SUITE_IN_CCPP_FP"],
+        workflow_config["CCPP_PHYS_SUITE_FP"],
+        reflink=use_reflinks,
+    )
     #
     # Copy the field dictionary file from its location in the
     # clone of the FV3 code repository to the experiment directory (EXPT-
@@ -289,7 +414,11 @@ def generate_FV3LAM_wflow(
         directory...""",
         verbose=debug,
     )
-    cp_vrfy(FIELD_DICT_IN_UWM_FP, FIELD_DICT_FP)
+    cp_vrfy(
+        workflow_config["FIELD_DICT_IN_UWM_FP"],
+        workflow_config["FIELD_DICT_FP"],
+        reflink=use_reflinks,
+    )
     #
     # -----------------------------------------------------------------------
     #
@@ -298,9 +427,10 @@ def generate_FV3LAM_wflow(
     # -----------------------------------------------------------------------
     #
     log_info(
-        f"""
+        """
         Setting parameters in weather model's namelist file (FV3_NML_FP):
-        FV3_NML_FP = '{FV3_NML_FP}'""",
+        FV3_NML_FP = '{}'""",
+        workflow_config["FV3_NML_FP"],
         verbose=debug,
     )
     #
@@ -309,18 +439,18 @@ def generate_FV3LAM_wflow(
     # the number of cell vertices in the x and y directions on the regional
     # grid.
     #
-    npx = NX + 1
-    npy = NY + 1
+    npx = grid_params["NX"] + 1
+    npy = grid_params["NY"] + 1
     #
     # Set npz, which is just LEVP minus 1.
-    npz = LEVP - 1
+    npz = expt_config["task_make_ics"]["LEVP"] - 1
     #
     # For the physics suites that use RUC LSM, set the parameter kice to 9,
     # Otherwise, leave it unspecified (which means it gets set to the default
     # value in the forecast model).
     #
     kice = None
-    if SDF_USES_RUC_LSM:
+    if workflow_config["SDF_USES_RUC_LSM"]:
         kice = 9
     #
     # Set lsoil, which is the number of input soil levels provided in the
@@ -337,9 +467,12 @@ def generate_FV3LAM_wflow(
     # Also, may want to set lsm here as well depending on SDF_USES_RUC_LSM.
     #
     lsoil = 4
-    if EXTRN_MDL_NAME_ICS in ("HRRR", "RAP") and SDF_USES_RUC_LSM:
+    if (
+        expt_config["task_get_extrn_ics"]["EXTRN_MDL_NAME_ICS"] in ("HRRR", "RAP")
+        and workflow_config["SDF_USES_RUC_LSM"]
+    ):
         lsoil = 9
-    if CCPP_PHYS_SUITE == "FV3_GFS_v15_thompson_mynn_lam3km":
+    if workflow_config["CCPP_PHYS_SUITE"] == "FV3_GFS_v15_thompson_mynn_lam3km":
         lsoil = ""
     #
     # Create a multiline variable that consists of a yaml-compliant string
@@ -361,15 +494,15 @@ def generate_FV3LAM_wflow(
     #
     settings = {}
     settings["atmos_model_nml"] = {
-        "blocksize": BLOCKSIZE,
-        "ccpp_suite": CCPP_PHYS_SUITE,
+        "blocksize": fcst_config["BLOCKSIZE"],
+        "ccpp_suite": workflow_config["CCPP_PHYS_SUITE"],
     }
 
     fv_core_nml_dict = {}
     fv_core_nml_dict.update({
-        "target_lon": LON_CTR,
-        "target_lat": LAT_CTR,
-        "nrows_blend": HALO_BLEND,
+        "target_lon": grid_params["LON_CTR"],
+        "target_lat": grid_params["LAT_CTR"],
+        "nrows_blend": global_sect["HALO_BLEND"],
         #
         # Question:
         # For a ESGgrid type grid, what should stretch_fac be set to?  This depends
@@ -378,15 +511,15 @@ def generate_FV3LAM_wflow(
         # to something like 0.9999, but is it ok to set it to that here in the
         # FV3 namelist file?
         #
-        "stretch_fac": STRETCH_FAC,
+        "stretch_fac": grid_params["STRETCH_FAC"],
         "npx": npx,
         "npy": npy,
-        "layout": [LAYOUT_X, LAYOUT_Y],
-        "bc_update_interval": LBC_SPEC_INTVL_HRS,
+        "layout": [fcst_config["LAYOUT_X"], fcst_config["LAYOUT_Y"]],
+        "bc_update_interval": expt_config["task_get_extrn_lbcs"]["LBC_SPEC_INTVL_HRS"],
         "npz": npz,
     })
-    if CCPP_PHYS_SUITE == "FV3_GFS_v15p2":
-        if CPL_AQM:
+    if workflow_config["CCPP_PHYS_SUITE"] == "FV3_GFS_v15p2":
+        if expt_config["cpl_aqm_parm"]["CPL_AQM"]:
             fv_core_nml_dict.update({
                 "dnats": 5
             })
@@ -394,8 +527,8 @@ def generate_FV3LAM_wflow(
             fv_core_nml_dict.update({
                 "dnats": 1
             })
-    elif CCPP_PHYS_SUITE == "FV3_GFS_v16":
-        if CPL_AQM:
+    elif workflow_config["CCPP_PHYS_SUITE"] == "FV3_GFS_v16":
+        if expt_config["cpl_aqm_parm"]["CPL_AQM"]:
             fv_core_nml_dict.update({
                 "hord_tr": 8,
                 "dnats": 5,
@@ -405,8 +538,8 @@ def generate_FV3LAM_wflow(
             fv_core_nml_dict.update({
                 "dnats": 1
             })
-    elif CCPP_PHYS_SUITE == "FV3_GFS_v17_p8":
-        if CPL_AQM:
+    elif workflow_config["CCPP_PHYS_SUITE"] == "FV3_GFS_v17_p8":
+        if expt_config["cpl_aqm_parm"]["CPL_AQM"]:
             fv_core_nml_dict.update({
                 "dnats": 4
             })
@@ -421,10 +554,10 @@ def generate_FV3LAM_wflow(
     gfs_physics_nml_dict.update({
         "kice": kice or None,
         "lsoil": lsoil or None,
-        "print_diff_pgr": PRINT_DIFF_PGR,
+        "print_diff_pgr": global_sect["PRINT_DIFF_PGR"],
     })
 
-    if CPL_AQM:
+    if expt_config["cpl_aqm_parm"]["CPL_AQM"]:
         gfs_physics_nml_dict.update({
             "cplaqm": True,
             "cplocn2atm": False,
@@ -459,14 +592,14 @@ def generate_FV3LAM_wflow(
            "units",        "kg/kg"
        "profile_type", "fixed", "surface_value=0.0" /\n"""
 
-        with open(FIELD_TABLE_FP, "a+", encoding='UTF-8') as file:
+        with open(workflow_config["FIELD_TABLE_FP"], "a+", encoding='UTF-8') as file:
             file.write(field_table_append)
 
     settings["gfs_physics_nml"] = gfs_physics_nml_dict
 
     # Update levp in external_ic_nml; this should be the only variable that needs changing
 
-    settings["external_ic_nml"] = {"levp": LEVP}
+    settings["external_ic_nml"] = {"levp": expt_config["task_make_ics"]["LEVP"]}
 
     #
     # Add to "settings" the values of those namelist variables that specify
@@ -478,30 +611,31 @@ def generate_FV3LAM_wflow(
     # in the FIXam directory.  Here, we loop through this array and process
     # each element to construct each line of "settings".
     #
-    dummy_run_dir = os.path.join(EXPTDIR, "any_cyc")
-    if DO_ENSEMBLE:
+    dummy_run_dir = os.path.join(exptdir, "any_cyc")
+    if global_sect["DO_ENSEMBLE"]:
         dummy_run_dir = os.path.join(dummy_run_dir, "any_ensmem")
 
-    regex_search = "^[ ]*([^| ]+)[ ]*[|][ ]*([^| ]+)[ ]*$"
-    num_nml_vars = len(FV3_NML_VARNAME_TO_FIXam_FILES_MAPPING)
+    #
+    # If not in NCO mode, for portability and brevity, the paths are made
+    # relative to any cycle directory immediately under the experiment
+    # directory. Resolve the FIXam directory once here rather than for every
+    # file.
+    #
+    fixam_dir = workflow_config["FIXam"]
+    if expt_config["user"]["RUN_ENVIR"] != "nco":
+        fixam_dir = os.path.relpath(os.path.realpath(workflow_config["FIXam"]), start=dummy_run_dir)
+
     namsfc_dict = {}
-    for i in range(num_nml_vars):
+    for mapping in fixed_files["FV3_NML_VARNAME_TO_FIXam_FILES_MAPPING"]:
 
-        mapping = f"{FV3_NML_VARNAME_TO_FIXam_FILES_MAPPING[i]}"
-        tup = find_pattern_in_str(regex_search, mapping)
-        nml_var_name = tup[0]
-        FIXam_fn = tup[1]
+        # Each element has the form "<namelist variable> | <FIXam file name>"
+        nml_var_name, _, FIXam_fn = mapping.partition("|")
+        nml_var_name = nml_var_name.strip()
+        FIXam_fn = FIXam_fn.strip()
 
         fp = '""'
         if FIXam_fn:
-            fp = os.path.join(FIXam, FIXam_fn)
-            #
-            # If not in NCO mode, for portability and brevity, change fp so that it
-            # is a relative path (relative to any cycle directory immediately under
-            # the experiment directory).
-            #
-            if RUN_ENVIR != "nco":
-                fp = os.path.relpath(os.path.realpath(fp), start=dummy_run_dir)
+            fp = os.path.join(fixam_dir, FIXam_fn)
         #
         # Add a line to the variable "settings" that specifies (in a yaml-compliant
         # format) the name of the current namelist variable and the value it should
@@ -515,18 +649,17 @@ def generate_FV3LAM_wflow(
     #
     # Use netCDF4 when running the North American 3-km domain due to file size.
     #
-    if PREDEF_GRID_NAME == "RRFS_NA_3km":
+    if workflow_config["PREDEF_GRID_NAME"] == "RRFS_NA_3km":
         settings["fms2_io_nml"] = {"netcdf_default_format": "netcdf4"}
 
-    settings_str = cfg_to_yaml_str(settings)
-
-    log_info(
-        """
-        The variable 'settings' specifying values of the weather model's
-        namelist variables has been set as follows:\n""",
-        verbose=debug,
-    )
-    log_info("\nsettings =\n\n" + settings_str, verbose=debug)
+    # Only serialize the settings to YAML if they are going to be printed
+    if debug:
+        log_info(
+            """
+            The variable 'settings' specifying values of the weather model's
+            namelist variables has been set as follows:"""
+        )
+        log_info("\nsettings =\n\n" + cfg_to_yaml_str(settings))
     #
     # -----------------------------------------------------------------------
     #
@@ -535,9 +668,11 @@ def generate_FV3LAM_wflow(
     # -----------------------------------------------------------------------
     #
 
-    physics_cfg = get_yaml_config(FV3_NML_YAML_CONFIG_FP)
-    base_namelist = get_nml_config(FV3_NML_BASE_SUITE_FP)
-    base_namelist.update_values(physics_cfg[CCPP_PHYS_SUITE])
+    physics_cfg = load_config_cached(
+        workflow_config["FV3_NML_YAML_CONFIG_FP"], load_yaml_json_cached
+    )
+    base_namelist = load_config_cached(workflow_config["FV3_NML_BASE_SUITE_FP"], get_nml_config)
+    base_namelist.update_values(physics_cfg[workflow_config["CCPP_PHYS_SUITE"]])
     base_namelist.update_values(settings)
     for sect, values in base_namelist.copy().items():
         if not values:
@@ -546,7 +681,7 @@ def generate_FV3LAM_wflow(
         for k, v in values.copy().items():
             if v is None:
                 del base_namelist[sect][k]
-    base_namelist.dump(FV3_NML_FP)
+    base_namelist.dump(workflow_config["FV3_NML_FP"])
     #
     # If not running the TN_MAKE_GRID task (which implies the workflow will
     # use pregenerated grid files), set the namelist variables specifying
@@ -561,7 +696,7 @@ def generate_FV3LAM_wflow(
     #
     if not expt_config['rocoto']['tasks'].get('task_make_grid'):
 
-        set_fv3nml_sfc_climo_filenames(flatten_dict(expt_config), debug)
+        set_fv3nml_sfc_climo_filenames(flat_expt_config, debug)
 
     #
     # -----------------------------------------------------------------------
@@ -573,100 +708,29 @@ def generate_FV3LAM_wflow(
     #
     # -----------------------------------------------------------------------
     #
+    do_shum = global_sect["DO_SHUM"]
+    do_sppt = global_sect["DO_SPPT"]
+    do_skeb = global_sect["DO_SKEB"]
+    do_spp = global_sect["DO_SPP"]
+    do_lsm_spp = global_sect["DO_LSM_SPP"]
+
     settings = {}
     settings["gfs_physics_nml"] = {
-        "do_shum": DO_SHUM,
-        "do_sppt": DO_SPPT,
-        "do_skeb": DO_SKEB,
-        "do_spp": DO_SPP,
-        "n_var_spp": N_VAR_SPP,
-        "n_var_lndp": N_VAR_LNDP,
-        "lndp_type": LNDP_TYPE,
-        "fhcyc": FHCYC_LSM_SPP_OR_NOT,
+        "do_shum": do_shum,
+        "do_sppt": do_sppt,
+        "do_skeb": do_skeb,
+        "do_spp": do_spp,
+        "n_var_spp": global_sect["N_VAR_SPP"],
+        "n_var_lndp": global_sect["N_VAR_LNDP"],
+        "lndp_type": global_sect["LNDP_TYPE"],
+        "fhcyc": global_sect["FHCYC_LSM_SPP_OR_NOT"],
     }
-    nam_stochy_dict = {}
-    if DO_SPPT:
-        nam_stochy_dict.update(
-            {
-                "iseed_sppt": ISEED_SPPT,
-                "new_lscale": NEW_LSCALE,
-                "sppt": SPPT_MAG,
-                "sppt_logit": SPPT_LOGIT,
-                "sppt_lscale": SPPT_LSCALE,
-                "sppt_sfclimit": SPPT_SFCLIMIT,
-                "sppt_tau": SPPT_TSCALE,
-                "spptint": SPPT_INT,
-                "use_zmtnblck": USE_ZMTNBLCK,
-            }
-        )
-
-    if DO_SHUM:
-        nam_stochy_dict.update(
-            {
-                "iseed_shum": ISEED_SHUM,
-                "new_lscale": NEW_LSCALE,
-                "shum": SHUM_MAG,
-                "shum_lscale": SHUM_LSCALE,
-                "shum_tau": SHUM_TSCALE,
-                "shumint": SHUM_INT,
-            }
-        )
-
-    if DO_SKEB:
-        nam_stochy_dict.update(
-            {
-                "iseed_skeb": ISEED_SKEB,
-                "new_lscale": NEW_LSCALE,
-                "skeb": SKEB_MAG,
-                "skeb_lscale": SKEB_LSCALE,
-                "skebnorm": SKEBNORM,
-                "skeb_tau": SKEB_TSCALE,
-                "skebint": SKEB_INT,
-                "skeb_vdof": SKEB_VDOF,
-            }
-        )
-
-    if DO_SPP or DO_LSM_SPP:
-        nam_stochy_dict.update({"new_lscale": NEW_LSCALE})
-
-    settings["nam_stochy"] = nam_stochy_dict
-    #
-    # Add the relevant SPP namelist variables to "settings" when running with
-    # SPP turned on.  Otherwise only include an empty "nam_sppperts" stanza.
+    settings["nam_stochy"] = build_nam_stochy(global_sect)
     #
-    nam_sppperts_dict = {}
-    if DO_SPP:
-        nam_sppperts_dict = {
-            "iseed_spp": ISEED_SPP,
-            "spp_lscale": SPP_LSCALE,
-            "spp_prt_list": SPP_MAG_LIST,
-            "spp_sigtop1": SPP_SIGTOP1,
-            "spp_sigtop2": SPP_SIGTOP2,
-            "spp_stddev_cutoff": SPP_STDDEV_CUTOFF,
-            "spp_tau": SPP_TSCALE,
-            "spp_var_list": SPP_VAR_LIST,
-        }
-
-    settings["nam_sppperts"] = nam_sppperts_dict
+    # Add the relevant SPP and LSM SPP namelist variables to "settings" when
+    # running with those turned on.  Otherwise only include empty stanzas.
     #
-    # Add the relevant LSM SPP namelist variables to "settings" when running with
-    # LSM SPP turned on.
-    #
-    nam_sfcperts_dict = {}
-    if DO_LSM_SPP:
-        nam_sfcperts_dict = {
-            "lndp_type": LNDP_TYPE,
-            "lndp_model_type": LNDP_MODEL_TYPE,
-            "lndp_tau": LSM_SPP_TSCALE,
-            "lndp_lscale": LSM_SPP_LSCALE,
-            "iseed_lndp": ISEED_LSM_SPP,
-            "lndp_var_list": LSM_SPP_VAR_LIST,
-            "lndp_prt_list": LSM_SPP_MAG_LIST,
-        }
-
-    settings["nam_sfcperts"] = nam_sfcperts_dict
-
-    settings_str = cfg_to_yaml_str(settings)
+    settings.update(build_spp_nml_stanzas(global_sect))
     #
     #-----------------------------------------------------------------------
     #
@@ -674,11 +738,11 @@ def generate_FV3LAM_wflow(
     #
     #-----------------------------------------------------------------------
     #
-    if any((DO_SPP, DO_SPPT, DO_SHUM, DO_SKEB, DO_LSM_SPP)):
+    if any((do_spp, do_sppt, do_shum, do_skeb, do_lsm_spp)):
         realize(
-            input_config=FV3_NML_FP,
+            input_config=workflow_config["FV3_NML_FP"],
             input_format="nml",
-            output_file=FV3_NML_STOCH_FP,
+            output_file=workflow_config["FV3_NML_STOCH_FP"],
             output_format="nml",
             update_config=get_nml_config(settings),
             )
@@ -724,14 +788,15 @@ def generate_FV3LAM_wflow(
 
         # The variables specific to each ignition need special handling: SRW uses a list, but the
         # fire model has these settings as separate namelist entries
-        for i in range(expt_config['fire']['FIRE_NUM_IGNITIONS']):
-            for setting in each_ignit:
-                # If not a list, convert to a 1-element list
-                if not isinstance(expt_config['fire'][setting], list):
-                    expt_config['fire'][setting] = [ expt_config['fire'][setting] ]
+        num_ignitions = expt_config['fire']['FIRE_NUM_IGNITIONS']
+        for setting in each_ignit:
+            values = expt_config['fire'][setting]
+            # If not a list, convert to a 1-element list
+            if not isinstance(values, list):
+                values = [values]
 
-                nmle = f"{setting.lower()}{i+1}"
-                fire_nml_dict['fire'][nmle] = expt_config['fire'][setting][i]
+            for i, value in enumerate(values[:num_ignitions], start=1):
+                fire_nml_dict['fire'][f"{setting.lower()}{i}"] = value
 
         realize(
             input_config=expt_config['workflow']['FIRE_NML_BASE_FP'],
@@ -750,7 +815,7 @@ def generate_FV3LAM_wflow(
     #
     # -----------------------------------------------------------------------
     #
-    cp_vrfy(os.path.join(ushdir, config), EXPTDIR)
+    cp_vrfy(os.path.join(ushdir, config), exptdir, reflink=use_reflinks)
 
     #
     # -----------------------------------------------------------------------
@@ -762,49 +827,21 @@ def generate_FV3LAM_wflow(
     #
     # -----------------------------------------------------------------------
     #
-    if WORKFLOW_MANAGER == "rocoto":
-        wflow_db_fn = f"{os.path.splitext(WFLOW_XML_FN)[0]}.db"
-        rocotorun_cmd = f"rocotorun -w {WFLOW_XML_FN} -d {wflow_db_fn} -v 10"
-        rocotostat_cmd = f"rocotostat -w {WFLOW_XML_FN} -d {wflow_db_fn} -v 10"
-
-        # pylint: disable=line-too-long
+    if use_rocoto:
         log_info(
-            f"""
-            To launch the workflow, change location to the experiment directory
-            (EXPTDIR) and issue the rocotrun command, as follows:
-
-              > cd {EXPTDIR}
-              > {rocotorun_cmd}
-
-            To check on the status of the workflow, issue the rocotostat command
-            (also from the experiment directory):
-
-              > {rocotostat_cmd}
-
-            Note that:
-
-            1) The rocotorun command must be issued after the completion of each
-               task in the workflow in order for the workflow to submit the next
-               task(s) to the queue.
-
-            2) In order for the output of the rocotostat command to be up-to-date,
-               the rocotorun command must be issued immediately before issuing the
-               rocotostat command.
-
-            For automatic resubmission of the workflow (say every {CRON_RELAUNCH_INTVL_MNTS} minutes), the
-            following line can be added to the user's crontab (use 'crontab -e' to
-            edit the cron table):
-
-            */{CRON_RELAUNCH_INTVL_MNTS} * * * * cd {EXPTDIR} && ./launch_FV3LAM_wflow.sh called_from_cron="TRUE"
-            """
+            _ROCOTO_INSTRUCTIONS,
+            exptdir=exptdir,
+            rocotorun_cmd=rocotorun_cmd,
+            rocotostat_cmd=rocotostat_cmd,
+            cron_relaunch_intvl_mnts=workflow_config["CRON_RELAUNCH_INTVL_MNTS"],
+            dedent_=False,
         )
-        # pylint: enable=line-too-long
 
     # If we got to this point everything was successful: move the log
     # file to the experiment directory.
-    mv_vrfy(logfile, EXPTDIR)
+    mv_vrfy(logfile, exptdir)
 
-    return EXPTDIR
+    return exptdir
 
 
 def setup_logging(logfile: str = "log.generate_FV3LAM_wflow", debug: bool = False) -> None:
@@ -856,6 +893,8 @@ if __name__ == "__main__":
                         help='Name of experiment config file in YAML format')
     parser.add_argument('-d', '--debug', action='store_true',
                         help='Script will be run in debug mode with more verbose output')
+    parser.add_argument('--no-reflinks', dest='use_reflinks', action='store_false',
+                        help='Do not try copy-on-write clones when copying files')
     pargs = parser.parse_args()
 
     USHdir = os.path.dirname(os.path.abspath(__file__))
@@ -864,32 +903,14 @@ if __name__ == "__main__":
     # Call the generate_FV3LAM_wflow function defined above to generate the
     # experiment/workflow.
     try:
-        expt_dir = generate_FV3LAM_wflow(USHdir, pargs.config, wflow_logfile, pargs.debug)
-    except: # pylint: disable=bare-except
-        logging.exception(
-            dedent(
-                f"""
-                *********************************************************************
-                FATAL ERROR:
-                Experiment generation failed. See the error message(s) printed below.
-                For more detailed information, check the log file from the workflow
-                generation script: {wflow_logfile}
-                *********************************************************************\n
-                """
-            )
+        expt_dir = generate_FV3LAM_wflow(
+            USHdir, pargs.config, wflow_logfile, pargs.debug, pargs.use_reflinks
         )
+    # print_err_msg_exit() reports failures with sys.exit(), so SystemExit gets the
+    # same treatment as any other error; a KeyboardInterrupt is let through
+    except (Exception, SystemExit): # pylint: disable=broad-exception-caught
+        logging.exception(_FATAL_ERROR_MSG.format(wflow_logfile))
         sys.exit(1)
 
-    # pylint: disable=undefined-variable
     # Note workflow generation completion
-    log_info(
-        f"""
-        ========================================================================
-
-            Experiment generation completed.  The experiment directory is:
-
-              EXPTDIR='{EXPTDIR}'
-
-        ========================================================================
-        """
-    )
+    log_info(_COMPLETION_BANNER, expt_dir, dedent_=False)
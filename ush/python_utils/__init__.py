@@ -18,6 +18,7 @@ from .environment import (
 from .filesys_cmds_vrfy import (
     cmd_vrfy,
     cp_vrfy,
+    copy_if_stale,
     mv_vrfy,
     rm_vrfy,
     ln_vrfy,
@@ -27,6 +28,7 @@ from .filesys_cmds_vrfy import (
 from .print_input_args import print_input_args
 from .print_msg import print_info_msg, print_err_msg_exit, log_info
 from .run_command import run_command
+from .config_cache import load_config_cached, load_yaml_json_cached
 from .xml_parser import load_xml_file, has_tag_with_value
 from .config_parser import (
     load_json_config,
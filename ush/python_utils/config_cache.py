@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+"""
+Cached loading of configuration files, so that files that have not changed since they were
+last read are not parsed again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from copy import deepcopy
+
+try:
+    import yaml
+except ModuleNotFoundError:
+    pass
+
+# Parsed namelist and YAML input files, keyed by path and loader, so that
+# generating several experiments in one process (e.g. the WE2E driver) reads
+# each file only once while it is unchanged
+_CONFIG_CACHE = OrderedDict()
+_CONFIG_CACHE_SIZE = 100
+
+
+def load_config_cached(config_fp: str, loader):
+    """
+    Loads a configuration file with the given loader, reusing the result of an earlier call if
+    the file's modification time and size have not changed since. A deep copy is returned, so
+    callers are free to modify it.
+
+    Args:
+        config_fp (str): The path to the configuration file
+        loader         : Callable that takes the path and returns the parsed configuration
+    Returns:
+        A copy of the parsed configuration
+    """
+    stat = os.stat(config_fp)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    key = (os.path.abspath(config_fp), loader)
+
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        _CONFIG_CACHE.move_to_end(key)
+        return deepcopy(cached[1])
+
+    cfg = loader(config_fp)
+    _CONFIG_CACHE[key] = (stamp, cfg)
+    _CONFIG_CACHE.move_to_end(key)
+    while len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+        _CONFIG_CACHE.popitem(last=False)
+    return deepcopy(cfg)
+
+
+def load_yaml_json_cached(yaml_fp: str) -> dict:
+    """
+    Loads a YAML file through a JSON copy of its contents stored next to it
+    (``<yaml_fp>.cache.json``), which is much faster to parse. The copy records a hash of the YAML
+    it was made from and is only used while that still matches; otherwise the YAML is parsed and
+    the copy rewritten. Failing to write the copy (e.g. in a read-only installation) is not an
+    error.
+
+    Args:
+        yaml_fp (str): The path to the YAML file
+    Returns:
+        The contents of the YAML file
+    """
+    with open(yaml_fp, "rb") as yaml_file:
+        content = yaml_file.read()
+    content_hash = hashlib.blake2b(content, digest_size=16).hexdigest()
+    cache_fp = f"{yaml_fp}.cache.json"
+
+    try:
+        with open(cache_fp, "r", encoding="utf-8") as cache_file:
+            cached = json.load(cache_file)
+        if cached.get("_content_hash") == content_hash:
+            return cached["config"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    cfg = yaml.load(content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+    # Only cache contents that survive the trip through JSON unchanged (e.g. no
+    # dates or non-string keys)
+    cache_str = json.dumps({"_content_hash": content_hash, "config": cfg}, default=str)
+    if json.loads(cache_str)["config"] == cfg:
+        tmp_fp = f"{cache_fp}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_fp, "w", encoding="utf-8") as cache_file:
+                cache_file.write(cache_str)
+            os.replace(tmp_fp, cache_fp)
+        except OSError as e:
+            logging.debug(f"Could not write {cache_fp}: {e}")
+            if os.path.exists(tmp_fp):
+                os.remove(tmp_fp)
+    return cfg
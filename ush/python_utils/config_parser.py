@@ -18,13 +18,15 @@ returned by ``load_config`` to make queries.
 import argparse
 import configparser
 import datetime
+from functools import lru_cache
 import json
 import os
 import pathlib
 import re
+import shlex
+import subprocess
 from textwrap import dedent
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
 
 import jinja2
 #
@@ -37,8 +39,13 @@ try:
 except ModuleNotFoundError:
     pass
 
+# orjson is an optional, faster JSON parser
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
 from .environment import list_to_str, str_to_list, str_to_type
-from .run_command import run_command
 
 ##########
 # YAML
@@ -54,7 +61,7 @@ def load_yaml_config(config_file):
     """
 
     with open(config_file, "r") as f:
-        cfg = yaml.safe_load(f)
+        cfg = yaml.load(f, Loader=_yaml_loader)
 
     return cfg
 
@@ -82,6 +89,10 @@ try:
 
     yaml.add_representer(str, _str_presenter)
 
+    # Use the libyaml emitter for cfg_to_yaml_str when PyYAML was built with it
+    _yaml_dumper = getattr(yaml, "CDumper", yaml.Dumper)
+    yaml.add_representer(str, _str_presenter, Dumper=_yaml_dumper)
+
 except NameError:
     pass
 
@@ -92,7 +103,7 @@ def cfg_to_yaml_str(cfg):
     """
 
     return yaml.dump(
-        cfg, sort_keys=False, default_flow_style=False
+        cfg, Dumper=_yaml_dumper, sort_keys=False, default_flow_style=False
     )
 
 def cycstr(loader, node):
@@ -105,10 +116,10 @@ def cycstr(loader, node):
     arg = loader.construct_scalar(node)
     return f'<cyclestr>{arg}</cyclestr>'
 
-def include(filepaths):
-
+def _load_includes(filepaths):
     """
-    Returns a dictionary that includes the contents of the referenced YAML file(s).
+    Returns a dictionary that merges the contents of the referenced YAML
+    file(s). Relative paths are taken from the top of the SRW App.
     """
 
     srw_path = pathlib.Path(__file__).resolve().parents[0].parents[0]
@@ -119,10 +130,26 @@ def include(filepaths):
         if not os.path.isabs(filepath):
             abs_path = os.path.join(os.path.dirname(srw_path), filepath)
         with open(abs_path, 'r') as fp:
-            contents = yaml.load(fp, Loader=yaml.SafeLoader)
+            contents = yaml.load(fp, Loader=_yaml_loader)
         for key, value in contents.items():
             cfg[key] = value
-    return yaml.dump(cfg, sort_keys=False)
+    return cfg
+
+def include(filepaths):
+
+    """
+    Returns the contents of the referenced YAML file(s) as a YAML string,
+    for use as a Jinja2 filter whose output is rendered into a template.
+    """
+
+    return yaml.dump(_load_includes(filepaths), Dumper=_yaml_dumper, sort_keys=False)
+
+def _include(loader, node):
+    """
+    Custom tag handler that includes the contents of the referenced YAML
+    file(s) as a dictionary, without going through a YAML string
+    """
+    return _load_includes(loader.construct_sequence(node))
 
 def join_str(loader, node):
     """
@@ -150,11 +177,16 @@ def _nowtimestamp(loader, node):
     return "id_" + str(int(datetime.datetime.now().timestamp()))
 
 try:
-    yaml.add_constructor("!cycstr", cycstr, Loader=yaml.SafeLoader)
-    yaml.add_constructor("!include", include, Loader=yaml.SafeLoader)
-    yaml.add_constructor("!join_str", join_str, Loader=yaml.SafeLoader)
-    yaml.add_constructor("!startstopfreq", startstopfreq, Loader=yaml.SafeLoader)
-    yaml.add_constructor("!nowtimestamp", _nowtimestamp ,Loader=yaml.SafeLoader)
+    # Use the libyaml parser in this module when PyYAML was built with it.
+    # The tags are also registered on the pure-Python SafeLoader, which
+    # other scripts pass to yaml.load directly.
+    _yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    for _loader in (yaml.SafeLoader, _yaml_loader):
+        yaml.add_constructor("!cycstr", cycstr, Loader=_loader)
+        yaml.add_constructor("!include", _include, Loader=_loader)
+        yaml.add_constructor("!join_str", join_str, Loader=_loader)
+        yaml.add_constructor("!startstopfreq", startstopfreq, Loader=_loader)
+        yaml.add_constructor("!nowtimestamp", _nowtimestamp ,Loader=_loader)
 except NameError:
     pass
 
@@ -176,6 +208,25 @@ def days_ago(arg):
     return (datetime.date.today() -
             datetime.timedelta(days=arg)).strftime("%Y%m%d00")
 
+# Jinja2 environment used to fill in templates in config values. It is set up
+# once here rather than for every template.
+_J2ENV = jinja2.Environment(loader=jinja2.BaseLoader, undefined=jinja2.StrictUndefined)
+_J2ENV.filters["path_join"] = path_join
+_J2ENV.filters["days_ago"] = days_ago
+_J2ENV.filters["include"] = include
+
+# Double curly bracket expressions, and the start of any Jinja2 markup
+_JINJA_SPLIT_RE = re.compile(r"{{[^}]*}}")
+_HAS_TMPL = re.compile(r"\{\{|\{%").search
+
+@lru_cache(maxsize=4096)
+def _compile_template(template):
+    """
+    Returns the compiled Jinja2 template for the given source string. The
+    same fragments recur throughout a config, so each is compiled only once.
+    """
+    return _J2ENV.from_string(template)
+
 def extend_yaml(yaml_dict, full_dict=None, parent=None):
     """
     Updates ``yaml_dict`` in place by rendering any existing Jinja2 templates
@@ -198,15 +249,20 @@ def extend_yaml(yaml_dict, full_dict=None, parent=None):
         else:
 
             if not isinstance(val, list):
+                # Most values are plain scalars; skip them without any
+                # further work
+                if not isinstance(val, ET.Element) and _HAS_TMPL(
+                    val if isinstance(val, str) else str(val)
+                ) is None:
+                    continue
                 val = [val]
 
             for v_idx, v in enumerate(val):
                 # Save a bit of compute and only do this part for strings that
                 # contain the jinja double brackets.
-                v_str = str(v.text) if isinstance(v, ET.Element) else str(v)
-                if isinstance(v, ET.Element):
-                    print('ELEMENT VSTR', v_str, v.text, yaml_dict)
-                is_a_template = any((ele for ele in ["{{", "{%"] if ele in v_str))
+                is_elem = isinstance(v, ET.Element)
+                v_str = str(v.text) if is_elem else str(v)
+                is_a_template = _HAS_TMPL(v_str) is not None
                 if is_a_template:
                     # Find expressions first, and process them as a single template
                     # if they exist
@@ -216,55 +272,53 @@ def extend_yaml(yaml_dict, full_dict=None, parent=None):
                     # For example, we can save cycle-dependent templates to fill in
                     # at run time.
                     if "{%" in v_str:
-                        templates = [v_str]
+                        spans = [(0, len(v_str))]
                     else:
                         # Separates out all the double curly bracket pairs
-                        templates = [m.group() for m in
-                                re.finditer(r"{{[^}]*}}|\S", v_str)  if '{{'
-                                in m.group()]
+                        spans = [m.span() for m in _JINJA_SPLIT_RE.finditer(v_str)]
+                    templates = [v_str[start:end] for start, end in spans]
+                    # Values passed through the string filter are left as strings
+                    convert_type = not any("string" in tmpl for tmpl in templates)
                     data = []
                     for template in templates:
-                        j2env = jinja2.Environment(
-                            loader=jinja2.BaseLoader, undefined=jinja2.StrictUndefined
-                        )
-                        j2env.filters["path_join"] = path_join
-                        j2env.filters["days_ago"] = days_ago
-                        j2env.filters["include"] = include
                         try:
-                            j2tmpl = j2env.from_string(template)
-                        except:
+                            j2tmpl = _compile_template(template)
+                        except jinja2.TemplateSyntaxError:
                             print(f"ERROR filling template: {template}, {v_str}")
                             raise
                         try:
                             # Fill in a template that has the appropriate variables
                             # set.
                             template = j2tmpl.render(parent=parent, **yaml_dict, **full_dict)
-                        except jinja2.exceptions.UndefinedError as e:
+                        except (
+                            jinja2.exceptions.UndefinedError,
+                            ValueError,
+                            TypeError,
+                            ZeroDivisionError,
+                        ):
                             # Leave a templated field as-is in the resulting dict
                             pass
-                        except ValueError:
-                            pass
-                        except TypeError:
-                            pass
-                        except ZeroDivisionError:
-                            pass
-                        except:
+                        except Exception:
                             print(f"{k}: {template}")
                             raise
 
                         data.append(template)
 
-                    convert_type = True
-                    for tmpl, rendered in zip(templates, data):
-                        v_str = v_str.replace(tmpl, rendered)
-                        if "string" in tmpl:
-                            convert_type = False
+                    # Splice the results back in at the positions of their
+                    # templates
+                    pieces = []
+                    prev_end = 0
+                    for (start, end), rendered in zip(spans, data):
+                        pieces.append(v_str[prev_end:start])
+                        pieces.append(rendered)
+                        prev_end = end
+                    pieces.append(v_str[prev_end:])
+                    v_str = "".join(pieces)
 
                     if convert_type:
                         v_str = str_to_type(v_str, return_string=2)
 
-                    if isinstance(v, ET.Element):
-                        print('Replacing ET text with', v_str)
+                    if is_elem:
                         v.text = v_str
                     elif isinstance(yaml_dict[k], list):
                         yaml_dict[k][v_idx] = v_str
@@ -277,14 +331,31 @@ def extend_yaml(yaml_dict, full_dict=None, parent=None):
 ##########
 # JSON
 ##########
+# orjson turns integers that do not fit in 64 bits into floats, so files with
+# runs of 19 or more digits are left to json, which keeps them exact
+_LONG_DIGITS = re.compile(rb"\d{19}").search
+
+
 def load_json_config(config_file):
     """
     Loads JSON config file
     """
 
     try:
-        with open(config_file, "r") as f:
-            cfg = json.load(f)
+        if orjson is not None:
+            with open(config_file, "rb") as f:
+                data = f.read()
+            try:
+                if _LONG_DIGITS(data):
+                    cfg = json.loads(data)
+                else:
+                    cfg = orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # Let json decide; it also accepts NaN and Infinity
+                cfg = json.loads(data)
+        else:
+            with open(config_file, "r") as f:
+                cfg = json.load(f)
     except json.JSONDecodeError as e:
         raise Exception(f"Unable to load json file {config_file}")
 
@@ -313,18 +384,11 @@ def load_shell_as_ini_config(file_name, return_string=1):
         cfg = cfg.replace("# [", "[")
         cfg = cfg.replace("\\\n", " ")
 
-    # write content to temp file and load it as ini
-    temp_file = os.path.join(os.getcwd(), "_temp." + str(os.getpid()) + ".ini")
-    with open(temp_file, "w") as file:
-        file.write(cfg)
-
     # load it as a structured ini file
-    try:
-        cfg = load_ini_config(temp_file, return_string)
-    finally:
-        os.remove(temp_file)
-
-    return cfg
+    config = configparser.RawConfigParser()
+    config.optionxform = str
+    config.read_string(cfg, source=file_name)
+    return _ini_to_dict(config, return_string)
 
 
 def load_shell_config(config_file, return_string=0):
@@ -344,23 +408,33 @@ def load_shell_config(config_file, return_string=0):
     except:
         pass
 
-    # Save env vars before and after sourcing the scipt and then
-    # do a diff to get variables specifically defined/updated in the script
+    # Print the shell variables before and after sourcing the script, and
+    # keep the lines that are new in the second listing: those are the
+    # variables defined/updated in the script. Both listings come from the
+    # same bash process, so no temp files or diff are needed.
     # Method sounds brittle but seems to work ok so far
-    pid = os.getpid()
+    sep = "__SRW_SOURCED_CONFIG__"
     code = dedent(
-        f"""      #!/bin/bash
-      t1="./t1.{pid}"
-      t2="./t2.{pid}"
-      (set -o posix; set) > $t1
-      {{ . {config_file}; set +x; }} &>/dev/null
-      (set -o posix; set) > $t2
-      diff $t1 $t2 | grep "> " | cut -c 3-
-      rm -rf $t1 $t2
-    """
+        f"""\
+        (set -o posix; set)
+        echo {sep}
+        {{ . {shlex.quote(config_file)}; set +x; }} &>/dev/null
+        (set -o posix; set)
+        """
     )
-    (_, config_str, _) = run_command(code)
-    lines = config_str.splitlines()
+    # The script is fed through stdin so that it is not itself listed
+    # (as BASH_EXECUTION_STRING would be with bash -c)
+    config_str = subprocess.run(
+        ["bash", "-s"],
+        input=code,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        universal_newlines=True,
+        check=False,
+    ).stdout
+    before, _, after = config_str.partition(f"{sep}\n")
+    before = set(before.splitlines())
+    lines = [l for l in after.splitlines() if l not in before]
 
     # build the dictionary
     cfg = {}
@@ -377,28 +451,36 @@ def cfg_to_shell_str(cfg, kname=None):
     Gets contents of config file as shell script string
     """
 
-    shell_str = ""
+    parts = []
+    _cfg_to_shell_parts(cfg, kname, parts)
+    return "".join(parts)
+
+
+def _cfg_to_shell_parts(cfg, kname, parts):
+    """
+    Appends the lines of the shell script string for ``cfg`` to ``parts``
+    """
+
     for k, v in cfg.items():
         if isinstance(v, dict):
             if kname:
                 n_kname = f"{kname}.{k}"
             else:
                 n_kname = f"{k}"
-            shell_str += f"# [{n_kname}]\n"
-            shell_str += cfg_to_shell_str(v, n_kname)
-            shell_str += "\n"
+            parts.append(f"# [{n_kname}]\n")
+            _cfg_to_shell_parts(v, n_kname, parts)
+            parts.append("\n")
             continue
         # others
         v1 = list_to_str(v)
         if isinstance(v, list):
-            shell_str += f"{k}={v1}\n"
+            parts.append(f"{k}={v1}\n")
         else:
             # replace some problematic chars
             v1 = v1.replace("'", '"')
             v1 = v1.replace("\n", " ")
             # end problematic
-            shell_str += f"{k}='{v1}'\n"
-    return shell_str
+            parts.append(f"{k}='{v1}'\n")
 
 
 ##########
@@ -409,22 +491,41 @@ def load_ini_config(config_file, return_string=0):
     Loads a config file with a format similar to Microsoft's INI files
     """
 
-    if not os.path.exists(config_file):
+    config = configparser.RawConfigParser()
+    config.optionxform = str
+    try:
+        with open(config_file, "r") as f:
+            config.read_file(f)
+    except FileNotFoundError:
         raise FileNotFoundError(
             dedent(
                 f"""
                 The specified configuration file does not exist:
                 '{config_file}'"""
             )
-        )
+        ) from None
+    return _ini_to_dict(config, return_string)
+
+
+@lru_cache(maxsize=8192)
+def _cached_str_to_list(v, return_string):
+    """
+    Memoized ``str_to_list`` for INI option values, which often repeat
+    """
+    return str_to_list(v, return_string)
+
+
+def _ini_to_dict(config, return_string):
+    """
+    Converts the sections of a parsed INI config to a dictionary
+    """
 
-    config = configparser.RawConfigParser()
-    config.optionxform = str
-    config.read(config_file)
     config_dict = {s: dict(config.items(s)) for s in config.sections()}
     for _, vs in config_dict.items():
         for k, v in vs.items():
-            vs[k] = str_to_list(v, return_string)
+            v = _cached_str_to_list(v, return_string)
+            # Don't hand out the cached list itself
+            vs[k] = v.copy() if isinstance(v, list) else v
     return config_dict
 
 
@@ -446,23 +547,31 @@ def cfg_to_ini_str(cfg, kname=None):
     Gets contents of config file as INI string
     """
 
-    ini_str = ""
+    parts = []
+    _cfg_to_ini_parts(cfg, kname, parts)
+    return "".join(parts)
+
+
+def _cfg_to_ini_parts(cfg, kname, parts):
+    """
+    Appends the lines of the INI string for ``cfg`` to ``parts``
+    """
+
     for k, v in cfg.items():
         if isinstance(v, dict):
             if kname:
                 n_kname = f"{kname}.{k}"
             else:
                 n_kname = f"{k}"
-            ini_str += f"[{n_kname}]\n"
-            ini_str += cfg_to_ini_str(v, n_kname)
-            ini_str += "\n"
+            parts.append(f"[{n_kname}]\n")
+            _cfg_to_ini_parts(v, n_kname, parts)
+            parts.append("\n")
             continue
         v1 = list_to_str(v, True)
         if isinstance(v, list):
-            ini_str += f"{k}={v1}\n"
+            parts.append(f"{k}={v1}\n")
         else:
-            ini_str += f"{k}='{v1}'\n"
-    return ini_str
+            parts.append(f"{k}='{v1}'\n")
 
 
 ##########
@@ -474,29 +583,33 @@ def xml_to_dict(root, return_string):
     """
 
     cfg = {}
-    for child in root:
-        if len(list(child)) > 0:
-            r = xml_to_dict(child, return_string)
-            cfg[child.tag] = r
-        else:
-            cfg[child.tag] = str_to_list(child.text, return_string)
+    stack = [(root, cfg)]
+    while stack:
+        elem, elem_cfg = stack.pop()
+        for child in elem:
+            if len(child):
+                elem_cfg[child.tag] = child_cfg = {}
+                stack.append((child, child_cfg))
+            else:
+                elem_cfg[child.tag] = str_to_list(child.text, return_string)
     return cfg
 
 
 def dict_to_xml(d, tag):
     """Converts dictionary to an XML tree"""
 
-    elem = ET.Element(tag)
-    for k, v in d.items():
-        if isinstance(v, dict):
-            r = dict_to_xml(v, k)
-            elem.append(r)
-        else:
-            child = ET.Element(k)
-            child.text = list_to_str(v, True)
-            elem.append(child)
+    root = ET.Element(tag)
+    stack = [(root, d)]
+    while stack:
+        elem, elem_d = stack.pop()
+        for k, v in elem_d.items():
+            child = ET.SubElement(elem, k)
+            if isinstance(v, dict):
+                stack.append((child, v))
+            else:
+                child.text = list_to_str(v, True)
 
-    return elem
+    return root
 
 
 def load_xml_config(config_file, return_string=0):
@@ -504,9 +617,20 @@ def load_xml_config(config_file, return_string=0):
     Loads XML config file
     """
 
-    tree = ET.parse(config_file)
-    root = tree.getroot()
-    cfg = xml_to_dict(root, return_string)
+    # Build the same dictionary as xml_to_dict while the file is being
+    # parsed, clearing each element once it has been converted so that
+    # the whole tree is never held in memory.
+    stack = []
+    cfg = {}
+    for event, elem in ET.iterparse(config_file, events=("start", "end")):
+        if event == "start":
+            stack.append({})
+            continue
+        cfg = stack.pop()
+        if stack:
+            # Only elements with children produce a non-empty dict
+            stack[-1][elem.tag] = cfg or str_to_list(elem.text, return_string)
+        elem.clear()
     return cfg
 
 
@@ -516,11 +640,9 @@ def cfg_to_xml_str(cfg):
     """
 
     root = dict_to_xml(cfg, "root")
+    ET.indent(root, space="  ")
     r = ET.tostring(root, encoding="unicode")
-    r = minidom.parseString(r)
-    r = r.toprettyxml(indent="  ")
-    r = r.replace("&quot;", '"')
-    return r
+    return f'<?xml version="1.0" ?>\n{r}\n'
 
 
 ##################
@@ -537,13 +659,16 @@ def flatten_dict(dictionary, keys=None):
         A one-level deep dictionary for the selected set of keys
     """
     flat_dict = {}
-    for k, v in dictionary.items():
-        if not keys or k in keys:
+    # Depth-first walk with a stack of item iterators, one per open level
+    stack = [iter([(k, v) for k, v in dictionary.items() if not keys or k in keys])]
+    while stack:
+        for k, v in stack[-1]:
             if isinstance(v, dict):
-                r = flatten_dict(v)
-                flat_dict.update(r)
-            else:
-                flat_dict[k] = v
+                stack.append(iter(v.items()))
+                break
+            flat_dict[k] = v
+        else:
+            stack.pop()
     return flat_dict
 
 
@@ -558,13 +683,21 @@ def structure_dict(dict_o, dict_t):
         A dictionary with contents of dict_o following structure of dict_t
     """
     struct_dict = {}
-    for k, v in dict_t.items():
-        if isinstance(v, dict):
-            r = structure_dict(dict_o, v)
-            if r:
-                struct_dict[k] = r
-        elif k in dict_o.keys():
-            struct_dict[k] = dict_o[k]
+    # Depth-first walk over the template. A section is attached to its
+    # parent once it is complete, and only if it picked up any entries.
+    stack = [(iter(dict_t.items()), struct_dict, None, None)]
+    while stack:
+        items, struct, parent, key = stack[-1]
+        for k, v in items:
+            if isinstance(v, dict):
+                stack.append((iter(v.items()), {}, struct, k))
+                break
+            if k in dict_o:
+                struct[k] = dict_o[k]
+        else:
+            stack.pop()
+            if struct and parent is not None:
+                parent[key] = struct
     return struct_dict
 
 
@@ -577,25 +710,32 @@ def update_dict(dict_o, dict_t, provide_default=False):
     Returns:
         None
     """
-    for k, v in dict_o.copy().items():
-        if isinstance(v, dict):
-            if isinstance(dict_t.get(k), dict):
-                update_dict(v, dict_t[k], provide_default)
-            else:
+    # Depth-first walk over (source items, target) pairs. The items are
+    # listed up front since the source may be (part of) the target.
+    stack = [(iter(list(dict_o.items())), dict_t)]
+    while stack:
+        items, dict_t = stack[-1]
+        for k, v in items:
+            if isinstance(v, dict):
+                if isinstance(dict_t.get(k), dict):
+                    stack.append((iter(list(v.items())), dict_t[k]))
+                    break
                 dict_t[k] = v
-        elif v is None and k in dict_t.keys():
-            # remove the key if the source dict has null entry
-            del dict_t[k]
-        elif k in dict_t.keys():
-            if (
-                (not provide_default)
-                or (dict_t[k] is None)
-                or (len(dict_t[k]) == 0)
-                or ("{{" in dict_t[k])
-            ):
+            elif v is None and k in dict_t:
+                # remove the key if the source dict has null entry
+                del dict_t[k]
+            elif k in dict_t:
+                if (
+                    (not provide_default)
+                    or (dict_t[k] is None)
+                    or (len(dict_t[k]) == 0)
+                    or ("{{" in dict_t[k])
+                ):
+                    dict_t[k] = v
+            else:
                 dict_t[k] = v
-        elif k not in dict_t.keys():
-            dict_t[k] = v
+        else:
+            stack.pop()
 
 
 def check_structure_dict(dict_o, dict_t):
@@ -611,15 +751,19 @@ def check_structure_dict(dict_o, dict_t):
         dict: Invalid key-value pairs.
     """
     inval = {}
-    for k, v in dict_o.items():
-        if k in dict_t.keys():
-            v1 = dict_t[k]
-            if isinstance(v, dict) and isinstance(v1, dict):
-                r = check_structure_dict(v, v1)
-                if r:
-                    inval.update(r)
+    stack = [(iter(dict_o.items()), dict_t)]
+    while stack:
+        items, dict_t = stack[-1]
+        for k, v in items:
+            if k in dict_t:
+                v1 = dict_t[k]
+                if isinstance(v, dict) and isinstance(v1, dict):
+                    stack.append((iter(v.items()), v1))
+                    break
+            else:
+                inval[k] = v
         else:
-            inval[k] = v
+            stack.pop()
     return inval
 
 
@@ -632,17 +776,29 @@ def filter_dict(dict_o, keys_regex):
         keys_regex: Keys to retain (could be regex expression)
     """
 
-    keys = []
-    for k in keys_regex:
-        r = re.compile(k)
-        keys += list(filter(r.match, dict_o.keys()))
-    dict_t = {k: dict_o[k] for k in keys}
+    # An empty pattern would match every key
+    if not keys_regex:
+        return {}
+    match = re.compile("|".join(f"(?:{k})" for k in keys_regex)).match
+    dict_t = {k: v for k, v in dict_o.items() if match(k)}
     return dict_t
 
 
 ##################
 # CONFIG loader
 ##################
+# Loaders by file name extension; each is called with the file name and
+# return_string
+_LOADERS = {
+    "sh": load_shell_config,
+    "ini": load_ini_config,
+    "json": lambda file_name, _: load_json_config(file_name),
+    "yaml": lambda file_name, _: load_yaml_config(file_name),
+    "yml": lambda file_name, _: load_yaml_config(file_name),
+    "xml": load_xml_config,
+}
+
+
 def load_config_file(file_name, return_string=0):
     """
     Loads config file based on file name extension
@@ -652,23 +808,16 @@ def load_config_file(file_name, return_string=0):
     """
 
     ext = os.path.splitext(file_name)[1][1:]
-    if ext == "sh":
-        return load_shell_config(file_name, return_string)
-    if ext == "ini":
-        return load_ini_config(file_name, return_string)
-    if ext == "json":
-        return load_json_config(file_name)
-    if ext in ["yaml", "yml"]:
-        return load_yaml_config(file_name)
-    if ext == "xml":
-        return load_xml_config(file_name, return_string)
+    loader = _LOADERS.get(ext)
+    if loader is not None:
+        return loader(file_name, return_string)
 
     errstr = dedent(
              f"""
              Unrecognized file extension ({ext}) for config file: {file_name}
              
              Valid file extensions include:\n""")
-    errstr += " .sh\n .ini\n .json\n .yaml\n .yml\n .xml"
+    errstr += "\n".join(f" .{e}" for e in _LOADERS)
 
     raise ValueError(errstr)
 
@@ -261,6 +261,10 @@ def export_vars(dictionary=None, source_dict=None, env_vars=None):
     else:
         env_vars = {k: source_dict[k] if k in source_dict else None for k in env_vars}
 
+    # Collect the converted values first and write them in one batch; for
+    # os.environ every assignment is a putenv() call, so unchanged values
+    # are skipped.
+    updates = {}
     for k, v in env_vars.items():
         # skip functions and other unlikely variable names
         if callable(v):
@@ -269,4 +273,7 @@ def export_vars(dictionary=None, source_dict=None, env_vars=None):
             continue
         if not k or k[0] == "_":
             continue
-        dictionary[k] = list_to_str(v)
+        v = list_to_str(v)
+        if dictionary.get(k) != v:
+            updates[k] = v
+    dictionary.update(updates)
@@ -1,8 +1,19 @@
 #!/usr/bin/env python3
 
+import glob
 import os
-from .print_msg import print_err_msg_exit
+import shlex
+import shutil
+import stat
+import sys
 from .define_macos_utilities import define_macos_utilities
+from .print_msg import print_err_msg_exit
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
 
 def cmd_vrfy(cmd, *args):
     """Executes system command
@@ -21,15 +32,234 @@ def cmd_vrfy(cmd, *args):
     return ret
 
 
-def cp_vrfy(*args):
+def _split_args(args):
+    """Splits shell-style arguments into options and (glob-expanded) operands,
+    the same way the shell would have for the equivalent ``cmd_vrfy`` call.
+
+    Args:
+        args: Iterable of arguments; each may contain several space-separated words
+    Returns:
+        Tuple of (set of single-letter options, set of long options, list of operands)
+    """
+    opts = set()
+    long_opts = set()
+    operands = []
+    for word in shlex.split(" ".join([str(a) for a in args])):
+        if word.startswith("--"):
+            long_opts.add(word)
+        elif word.startswith("-") and len(word) > 1:
+            opts.update(word[1:])
+        elif any(c in word for c in "*?["):
+            # Like the shell, leave a pattern that matches nothing as-is
+            operands.extend(sorted(glob.glob(word)) or [word])
+        else:
+            operands.append(word)
+    return opts, long_opts, operands
+
+
+def _run_vrfy(cmd, args, func):
+    """Runs the Python equivalent of a filesystem command, exiting with an
+    error message if it fails.
+
+    Args:
+        cmd  (str): Name of the equivalent shell command (used in error messages)
+        args      : Arguments of the shell command
+        func      : Callable performing the operation
+    Returns:
+        Exit code
+    """
+    try:
+        func()
+    except OSError as e:
+        cmd = f"{cmd} " + " ".join([str(a) for a in args])
+        print_err_msg_exit(f"Command '{cmd}' failed:\n  {e}")
+    return 0
+
+
+# Minimum size of the buffer used for copies the kernel cannot perform by itself
+_COPY_BUFSIZE = 4 * 1024 * 1024
+
+
+def _copy_bufsize(fd):
+    """Returns the buffer size for a user-space copy to ``fd``: at least
+    ``_COPY_BUFSIZE``, or the preferred block size of its filesystem if that
+    is larger (e.g. the stripe size on some parallel filesystems).
+    """
+    try:
+        return max(_COPY_BUFSIZE, os.fstatvfs(fd).f_bsize)
+    except (AttributeError, OSError):
+        return _COPY_BUFSIZE
+
+
+def _copy_file_range(infd, outfd, count):
+    """Copies from ``infd`` to ``outfd`` until the end of the input is
+    reached, and returns the number of bytes copied.
+    """
+    copied = 0
+    while True:
+        sent = os.copy_file_range(infd, outfd, count)
+        if not sent:
+            return copied
+        copied += sent
+
+
+def _sendfile(infd, outfd, count):
+    """Same as ``_copy_file_range``, using ``sendfile``."""
+    copied = 0
+    while True:
+        sent = os.sendfile(outfd, infd, None, count)
+        if not sent:
+            return copied
+        copied += sent
+
+
+_KERNEL_COPIES = [
+    func
+    for func, name in ((_copy_file_range, "copy_file_range"), (_sendfile, "sendfile"))
+    if hasattr(os, name)
+]
+
+# Linux ioctl that clones (reflinks) a whole file on copy-on-write
+# filesystems such as Btrfs and XFS
+_FICLONE = 0x40049409
+
+
+def _reflink(infd, outfd):
+    """Makes ``outfd`` share the data extents of ``infd``. Returns True on
+    success, and False if the platform or filesystem cannot clone files.
+    """
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        fcntl.ioctl(outfd, _FICLONE, infd)
+    except OSError:
+        return False
+    return True
+
+
+def _fast_copy(src, dst, reflink=True, mode=0o666):
+    """Copies the contents of file ``src`` to ``dst``. If ``reflink`` is set,
+    the copy is first attempted as a copy-on-write clone, which shares the
+    data with the source instead of duplicating it. Otherwise the data is
+    moved by the kernel (``copy_file_range`` or ``sendfile``) when the
+    platform and the filesystems allow it, and through a large user-space
+    buffer as a last resort. Like ``cp``, ``mode`` (less the umask) is only
+    applied if ``dst`` is created; an existing ``dst`` keeps its mode.
+
+    Args:
+        src     (str): Source file
+        dst     (str): Destination file
+        reflink (bool): Whether to try a copy-on-write clone first
+        mode    (int): Permission bits of ``dst`` if it is created
+    Returns:
+        None
+    """
+    # Opening dst truncates it, so refuse to copy a file onto itself
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"'{src}' and '{dst}' are the same file")
+    with open(src, "rb") as fsrc, open(
+        dst, "wb", opener=lambda path, flags: os.open(path, flags, mode)
+    ) as fdst:
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        if reflink and _reflink(infd, outfd):
+            return
+        size = os.fstat(infd).st_size
+        # Files such as those in /proc report a size of 0, so their length is
+        # only known once they have been read
+        kernel_copies = _KERNEL_COPIES if size else []
+        for kernel_copy in kernel_copies:
+            try:
+                if kernel_copy(infd, outfd, max(size, _COPY_BUFSIZE)) >= size:
+                    return
+            except OSError:
+                # Only fall back if nothing has been written yet
+                if os.lseek(outfd, 0, os.SEEK_CUR) != 0:
+                    raise
+            # Some filesystems stop short of the end of the file; start over
+            # with the next way of copying
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+        shutil.copyfileobj(fsrc, fdst, _copy_bufsize(outfd))
+
+
+def _targets(operands, dest_is_dir):
+    """Pairs each source operand with its destination path, mirroring how
+    ``cp``/``mv``/``ln`` treat a trailing directory operand.
+    """
+    *srcs, dest = operands
+    if dest_is_dir:
+        return [(src, os.path.join(dest, os.path.basename(src.rstrip("/")))) for src in srcs]
+    if len(srcs) != 1:
+        raise NotADirectoryError(f"Target '{dest}' is not a directory")
+    return [(srcs[0], dest)]
+
+
+def cp_vrfy(*args, reflink=True):
     """Checks that the ``cp`` command executed successfully
 
     Args:
         *args: Iterable object containing command with its command line arguments
+        reflink (bool): Whether to try a copy-on-write clone of each file first
     Returns:
         Exit code
     """
-    return cmd_vrfy("cp", *args)
+    opts, long_opts, operands = _split_args(args)
+    if long_opts or not opts <= set("rRf") or len(operands) < 2:
+        return cmd_vrfy("cp", *args)
+
+    def _cp():
+        for src, dst in _targets(operands, os.path.isdir(operands[-1])):
+            # One stat of the source serves both the type check and the mode
+            src_mode = os.stat(src).st_mode
+            if stat.S_ISDIR(src_mode):
+                if not opts & set("rR"):
+                    raise IsADirectoryError(f"-r not specified; omitting directory '{src}'")
+                shutil.copytree(src, dst, symlinks=True, dirs_exist_ok=True)
+            else:
+                _fast_copy(src, dst, reflink, stat.S_IMODE(src_mode))
+
+    return _run_vrfy("cp", args, _cp)
+
+
+def copy_if_stale(src, dst, reflink=True):
+    """Copies file ``src`` to ``dst`` unless ``dst`` already exists with the
+    same size and modification time. The modification time is copied along
+    with the data so that a later call with the same source is a no-op. The
+    copy is written to a temporary file that then replaces ``dst``, so a
+    read-only ``dst`` can still be refreshed; the permission bits of ``src``
+    are not copied.
+
+    Args:
+        src     (str): Source file
+        dst     (str): Destination file
+        reflink (bool): Whether to try a copy-on-write clone first
+    Returns:
+        Exit code
+    """
+
+    def _copy():
+        src_stat = os.stat(src)
+        try:
+            dst_stat = os.stat(dst)
+        except FileNotFoundError:
+            dst_stat = None
+        if (
+            dst_stat is not None
+            and dst_stat.st_size == src_stat.st_size
+            and dst_stat.st_mtime_ns == src_stat.st_mtime_ns
+        ):
+            return
+        tmp = f"{dst}.{os.getpid()}.tmp"
+        try:
+            _fast_copy(src, tmp, reflink)
+            os.utime(tmp, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+            os.replace(tmp, dst)
+        finally:
+            if os.path.lexists(tmp):
+                os.remove(tmp)
+
+    return _run_vrfy("cp", (src, dst), _copy)
 
 
 def rsync_vrfy(*args):
@@ -51,7 +281,15 @@ def mv_vrfy(*args):
     Returns:
         Exit code
     """
-    return cmd_vrfy("mv", *args)
+    opts, long_opts, operands = _split_args(args)
+    if long_opts or not opts <= set("f") or len(operands) < 2:
+        return cmd_vrfy("mv", *args)
+
+    def _mv():
+        for src, dst in _targets(operands, os.path.isdir(operands[-1])):
+            shutil.move(src, dst)
+
+    return _run_vrfy("mv", args, _mv)
 
 
 def rm_vrfy(*args):
@@ -62,7 +300,20 @@ def rm_vrfy(*args):
     Returns:
         Exit code
     """
-    return cmd_vrfy("rm", *args)
+    opts, long_opts, operands = _split_args(args)
+    if long_opts or not opts <= set("rRf"):
+        return cmd_vrfy("rm", *args)
+
+    def _rm():
+        for path in operands:
+            if os.path.isdir(path) and not os.path.islink(path):
+                if not opts & set("rR"):
+                    raise IsADirectoryError(f"Cannot remove '{path}': Is a directory")
+                shutil.rmtree(path)
+            elif os.path.lexists(path) or "f" not in opts:
+                os.remove(path)
+
+    return _run_vrfy("rm", args, _rm)
 
 
 def ln_vrfy(*args):
@@ -74,12 +325,37 @@ def ln_vrfy(*args):
     Returns:
         Exit code
     """
-    return cmd_vrfy("ln", *args)
+    opts, long_opts, operands = _split_args(args)
+    relative = "r" in opts or "--relative" in long_opts
+    if (
+        "s" not in opts
+        or not opts <= set("sfnr")
+        or not long_opts <= {"--relative"}
+        or len(operands) < 2
+    ):
+        # Use GNU ln (gln on macOS) for options handled only by the command
+        define_macos_utilities()
+        return cmd_vrfy(os.getenv("LN_UTIL"), *args)
 
-    define_macos_utilities()
-    cmd_ln = os.getenv("LN_UTIL")
-    return cmd_vrfy(cmd_ln, *args)
+    def _ln():
+        dest = operands[-1]
+        # With -n, a symlink to a directory is treated as a plain file
+        dest_is_dir = os.path.isdir(dest) and not ("n" in opts and os.path.islink(dest))
+        if len(operands) == 2 and not dest_is_dir:
+            pairs = [(operands[0], dest)]
+        else:
+            pairs = _targets(operands, dest_is_dir)
+        for src, dst in pairs:
+            if relative:
+                # Like GNU ln -r, resolve symlinks on both sides first
+                src = os.path.relpath(
+                    os.path.realpath(src), os.path.realpath(os.path.dirname(os.path.abspath(dst)))
+                )
+            if "f" in opts and os.path.lexists(dst):
+                os.remove(dst)
+            os.symlink(src, dst)
 
+    return _run_vrfy("ln", args, _ln)
 
 
 def mkdir_vrfy(*args):
@@ -90,7 +366,18 @@ def mkdir_vrfy(*args):
     Returns:
         Exit code
     """
-    return cmd_vrfy("mkdir", *args)
+    opts, long_opts, operands = _split_args(args)
+    if long_opts or not opts <= set("p") or not operands:
+        return cmd_vrfy("mkdir", *args)
+
+    def _mkdir():
+        for path in operands:
+            if "p" in opts:
+                os.makedirs(path, exist_ok=True)
+            else:
+                os.mkdir(path)
+
+    return _run_vrfy("mkdir", args, _mkdir)
 
 
 def cd_vrfy(*args):
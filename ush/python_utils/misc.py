@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import re
+from functools import lru_cache
 
 
 def uppercase(s):
@@ -27,6 +28,12 @@ def lowercase(s):
     return s.lower()
 
 
+@lru_cache(maxsize=128)
+def _compile(pattern):
+    """Compiles a regex pattern, remembering recently used ones"""
+    return re.compile(pattern)
+
+
 def find_pattern_in_str(pattern, source):
     """Finds a regular expression (regex) pattern in a string
 
@@ -36,10 +43,8 @@ def find_pattern_in_str(pattern, source):
     Returns:
         A tuple of matched groups or None
     """
-    pattern = re.compile(pattern)
-    for match in re.finditer(pattern, source):
-        return match.groups()
-    return None
+    match = _compile(pattern).search(source)
+    return match.groups() if match else None
 
 
 def find_pattern_in_file(pattern, file_name):
@@ -51,9 +56,10 @@ def find_pattern_in_file(pattern, file_name):
     Returns:
         A tuple of matched groups or None
     """
-    pattern = re.compile(pattern)
+    search = _compile(pattern).search
     with open(file_name) as f:
         for line in f:
-            for match in re.finditer(pattern, line):
+            match = search(line)
+            if match:
                 return match.groups()
     return None
@@ -3,7 +3,7 @@
 import traceback
 import sys
 from textwrap import dedent, indent
-from logging import getLogger
+from logging import getLogger, INFO
 
 
 def print_err_msg_exit(error_msg="", stack_trace=True):
@@ -41,15 +41,18 @@ def print_info_msg(info_msg, verbose=True):
     return False
 
 
-def log_info(info_msg, verbose=True, dedent_=True):
+def log_info(info_msg, *args, verbose=True, dedent_=True, **kwargs):
     """
     Prints information message using the logging module. This function
     should not be used if Python logging has not been initialized.
 
     Args:
         info_msg (str): Info message to print
+        *args: Positional arguments for ``{}`` fields in ``info_msg``, filled in with
+               ``str.format`` only if the message is actually logged
         verbose (bool): Set to ``False`` to silence printing
         dedent_ (bool): Set to ``False`` to disable "dedenting"/formatting and print string as-is
+        **kwargs: Keyword arguments for named ``{}`` fields in ``info_msg``
     Returns:
         None
     """
@@ -57,8 +60,10 @@ def log_info(info_msg, verbose=True, dedent_=True):
     # "sys._getframe().f_back.f_code.co_name" returns the name of the calling function
     logger = getLogger(sys._getframe().f_back.f_code.co_name)
 
-    if verbose:
+    # Skip the formatting entirely when the message would be discarded
+    if verbose and logger.isEnabledFor(INFO):
         if dedent_:
-            logger.info(indent(dedent(info_msg), "  "))
-        else:
-            logger.info(info_msg)
+            info_msg = indent(dedent(info_msg), "  ")
+        if args or kwargs:
+            info_msg = info_msg.format(*args, **kwargs)
+        logger.info(info_msg)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+"""
+Render the rocoto workflow XML of an experiment, reusing an earlier result when the inputs
+have not changed.
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+
+from uwtools.api.template import render
+
+
+def render_rocoto_xml(
+        template_xml_fp: str,
+        wflow_xml_fp: str,
+        rocoto_yaml_fp: str,
+        cache_dir: str) -> None:
+    """
+    Renders the rocoto workflow XML template with the values in the rocoto YAML file. The last
+rendered file is kept in a cache together with a hash of the template and values it was
+rendered from, so that regenerating an experiment with unchanged inputs copies the previous
+result instead of rendering again.
+
+    Args:
+        template_xml_fp (str): The full path to the jinja template of the workflow XML
+        wflow_xml_fp    (str): The full path to the workflow XML file to write
+        rocoto_yaml_fp  (str): The full path to the YAML file with the template values
+        cache_dir       (str): The directory where rendered files are cached
+    Returns:
+        None
+    """
+    inputs_hash = hashlib.blake2b()
+    for fp in (template_xml_fp, rocoto_yaml_fp):
+        with open(fp, "rb") as input_file:
+            inputs_hash.update(input_file.read())
+        inputs_hash.update(b"\0")
+    key = inputs_hash.hexdigest()
+
+    # Only the latest rendering of each output file is kept
+    cached_fp = os.path.join(cache_dir, os.path.basename(wflow_xml_fp))
+    key_fp = f"{cached_fp}.hash"
+
+    try:
+        with open(key_fp, "r", encoding="utf-8") as key_file:
+            cache_hit = key_file.read() == key and os.path.isfile(cached_fp)
+    except OSError:
+        cache_hit = False
+    if cache_hit:
+        logging.debug(f"Reusing rendered workflow XML from {cached_fp}")
+        shutil.copyfile(cached_fp, wflow_xml_fp)
+        return
+
+    render(
+        input_file = template_xml_fp,
+        output_file = wflow_xml_fp,
+        values_src = rocoto_yaml_fp,
+        )
+
+    # The cache only saves time, so failing to populate it is not an error. The
+    # hash is written last, so an interrupted update is never mistaken for a hit.
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        if os.path.exists(key_fp):
+            os.remove(key_fp)
+        shutil.copyfile(wflow_xml_fp, cached_fp)
+        with open(key_fp, "w", encoding="utf-8") as key_file:
+            key_file.write(key)
+    except OSError as e:
+        logging.debug(f"Could not cache rendered workflow XML: {e}")
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+"""
+Namelist settings of the stochastic physics schemes (SPPT, SHUM, SKEB, SPP and LSM SPP).
+"""
+
+# Namelist variables of each stochastic physics scheme, paired with the
+# variables in the "global" section of the experiment configuration that
+# they are set from. new_lscale applies to every scheme; it is listed with
+# each of SPPT, SHUM and SKEB to keep its place in the namelist.
+_SPPT_NML_VARS = (
+    ("iseed_sppt", "ISEED_SPPT"),
+    ("new_lscale", "NEW_LSCALE"),
+    ("sppt", "SPPT_MAG"),
+    ("sppt_logit", "SPPT_LOGIT"),
+    ("sppt_lscale", "SPPT_LSCALE"),
+    ("sppt_sfclimit", "SPPT_SFCLIMIT"),
+    ("sppt_tau", "SPPT_TSCALE"),
+    ("spptint", "SPPT_INT"),
+    ("use_zmtnblck", "USE_ZMTNBLCK"),
+)
+_SHUM_NML_VARS = (
+    ("iseed_shum", "ISEED_SHUM"),
+    ("new_lscale", "NEW_LSCALE"),
+    ("shum", "SHUM_MAG"),
+    ("shum_lscale", "SHUM_LSCALE"),
+    ("shum_tau", "SHUM_TSCALE"),
+    ("shumint", "SHUM_INT"),
+)
+_SKEB_NML_VARS = (
+    ("iseed_skeb", "ISEED_SKEB"),
+    ("new_lscale", "NEW_LSCALE"),
+    ("skeb", "SKEB_MAG"),
+    ("skeb_lscale", "SKEB_LSCALE"),
+    ("skebnorm", "SKEBNORM"),
+    ("skeb_tau", "SKEB_TSCALE"),
+    ("skebint", "SKEB_INT"),
+    ("skeb_vdof", "SKEB_VDOF"),
+)
+_SPP_NML_VARS = (
+    ("iseed_spp", "ISEED_SPP"),
+    ("spp_lscale", "SPP_LSCALE"),
+    ("spp_prt_list", "SPP_MAG_LIST"),
+    ("spp_sigtop1", "SPP_SIGTOP1"),
+    ("spp_sigtop2", "SPP_SIGTOP2"),
+    ("spp_stddev_cutoff", "SPP_STDDEV_CUTOFF"),
+    ("spp_tau", "SPP_TSCALE"),
+    ("spp_var_list", "SPP_VAR_LIST"),
+)
+_LSM_SPP_NML_VARS = (
+    ("lndp_type", "LNDP_TYPE"),
+    ("lndp_model_type", "LNDP_MODEL_TYPE"),
+    ("lndp_tau", "LSM_SPP_TSCALE"),
+    ("lndp_lscale", "LSM_SPP_LSCALE"),
+    ("iseed_lndp", "ISEED_LSM_SPP"),
+    ("lndp_var_list", "LSM_SPP_VAR_LIST"),
+    ("lndp_prt_list", "LSM_SPP_MAG_LIST"),
+)
+
+# Namelist stanzas that are only filled in when their scheme is turned on,
+# as (stanza, flag, variables)
+_SPP_NML_STANZAS = (
+    ("nam_sppperts", "DO_SPP", _SPP_NML_VARS),
+    ("nam_sfcperts", "DO_LSM_SPP", _LSM_SPP_NML_VARS),
+)
+
+
+def build_nam_stochy(global_sect: dict) -> dict:
+    """
+    Builds the ``nam_stochy`` namelist stanza from the stochastic physics settings of an
+    experiment: the variables of each of SPPT, SHUM and SKEB that are turned on, and
+    ``new_lscale`` if any stochastic physics scheme is.
+
+    Args:
+        global_sect (dict): The "global" section of the experiment configuration
+    Returns:
+        The contents of the ``nam_stochy`` stanza
+    """
+    nam_stochy = {
+        nml_var: global_sect[var]
+        for flag, nml_vars in (
+            ("DO_SPPT", _SPPT_NML_VARS),
+            ("DO_SHUM", _SHUM_NML_VARS),
+            ("DO_SKEB", _SKEB_NML_VARS),
+        )
+        if global_sect[flag]
+        for nml_var, var in nml_vars
+    }
+    if global_sect["DO_SPP"] or global_sect["DO_LSM_SPP"]:
+        nam_stochy["new_lscale"] = global_sect["NEW_LSCALE"]
+    return nam_stochy
+
+
+def build_spp_nml_stanzas(global_sect: dict) -> dict:
+    """
+    Builds the SPP and LSM SPP namelist stanzas of an experiment. The stanza of a scheme that
+    is turned off is left empty.
+
+    Args:
+        global_sect (dict): The "global" section of the experiment configuration
+    Returns:
+        The contents of each stanza, keyed by stanza name
+    """
+    return {
+        stanza: {
+            nml_var: global_sect[var] for nml_var, var in nml_vars
+        } if global_sect[flag] else {}
+        for stanza, flag, nml_vars in _SPP_NML_STANZAS
+    }